@@ -31,8 +31,15 @@ app.use(
 );
 
 // --- Postgres ---
+// One shared pool per process: requests borrow a warm connection instead of
+// paying a TCP + auth handshake each time.
 const pool = new Pool({
   connectionString: process.env.DATABASE_URL,
+  min: parseInt(process.env.PG_POOL_MIN || "5", 10),
+  max: parseInt(process.env.PG_POOL_MAX || "20", 10),
+  idleTimeoutMillis: 30000,
+  connectionTimeoutMillis: 5000,
+  statement_timeout: 60000,
 });
 
 // Create users table if not exists
@@ -55,6 +62,8 @@ pool.query(initSql).catch((e) => {
 const redis = new Redis(process.env.REDIS_URL || "redis://localhost:6379/0");
 const SESSION_TTL = parseInt(process.env.SESSION_TTL_SECONDS || "2592000", 10); // 30d
 const COOKIE_SECURE = (process.env.COOKIE_SECURE || "false") === "true";
+// bcrypt cost for new hashes; existing hashes keep the cost they were created with
+const BCRYPT_ROUNDS = parseInt(process.env.BCRYPT_ROUNDS || "10", 10);
 
 function setSessionCookie(res, sid) {
   res.cookie("sid", sid, {
@@ -76,6 +85,37 @@ async function destroySession(sid) {
   await redis.del(`sid:${sid}`);
 }
 
+// Small process-local cache of user rows for /me. The session itself is still
+// checked in Redis on every call, so logout takes effect immediately; only the
+// (rarely changing) id/email/name lookup is skipped.
+const USER_CACHE_TTL_MS = 60 * 1000;
+const USER_CACHE_MAX = 10000;
+const userCache = new Map(); // userId -> { user, expires }
+
+function cacheUser(user) {
+  const key = String(user.id);
+  // Re-insert so a refreshed entry moves to the end of the iteration order
+  userCache.delete(key);
+  if (userCache.size >= USER_CACHE_MAX) {
+    // Map iterates in insertion order and every entry has the same TTL,
+    // so the first entry is the one closest to expiring
+    userCache.delete(userCache.keys().next().value);
+  }
+  userCache.set(key, { user, expires: Date.now() + USER_CACHE_TTL_MS });
+}
+
+async function getUserById(userId) {
+  const hit = userCache.get(userId);
+  if (hit) {
+    if (hit.expires > Date.now()) return hit.user;
+    userCache.delete(userId);
+  }
+  const { rows } = await pool.query("SELECT id, email, name FROM users WHERE id=$1", [userId]);
+  if (!rows.length) return null;
+  cacheUser(rows[0]);
+  return rows[0];
+}
+
 // --- Routes ---
 
 /**
@@ -88,7 +128,7 @@ app.post("/api/auth/register", async (req, res) => {
     return res.status(400).json({ error: "email, name, and password are required" });
   }
   try {
-    const hash = await bcrypt.hash(password, 10);
+    const hash = await bcrypt.hash(password, BCRYPT_ROUNDS);
     const { rows } = await pool.query(
       "INSERT INTO users (email, name, password_hash) VALUES ($1, $2, $3) RETURNING id, email, name, created_at",
       [email.toLowerCase(), name, hash]
@@ -124,7 +164,9 @@ app.post("/api/auth/login", async (req, res) => {
 
     const sid = await createSession(user.id);
     setSessionCookie(res, sid);
-    res.json({ id: user.id, email: user.email, name: user.name });
+    const profile = { id: user.id, email: user.email, name: user.name };
+    cacheUser(profile); // later /me calls for this session skip the DB
+    res.json(profile);
   } catch (e) {
     console.error(e);
     res.status(500).json({ error: "Internal error" });
@@ -151,9 +193,9 @@ app.get("/api/auth/me", async (req, res) => {
   if (!sid) return res.status(401).json({ error: "Not authenticated" });
   const userId = await redis.get(`sid:${sid}`);
   if (!userId) return res.status(401).json({ error: "Session expired" });
-  const { rows } = await pool.query("SELECT id, email, name FROM users WHERE id=$1", [userId]);
-  if (!rows.length) return res.status(401).json({ error: "User not found" });
-  res.json(rows[0]);
+  const user = await getUserById(userId);
+  if (!user) return res.status(401).json({ error: "User not found" });
+  res.json(user);
 });
 
 app.get("/healthz", (_req, res) => res.json({ ok: true }));
@@ -1,5 +1,8 @@
 import React, { useEffect, useState } from 'react'
 
+// Must match the task service's default page size (TASKS_PAGE_SIZE)
+const TASK_PAGE_SIZE = 50
+
 const api = {
   async me() {
     const res = await fetch('/api/auth/me', { credentials: 'include' })
@@ -30,9 +33,19 @@ const api = {
     await fetch('/api/auth/logout', { method: 'POST', credentials: 'include' })
   },
   async listTasks() {
-    const res = await fetch('/api/tasks', { credentials: 'include' })
-    if (!res.ok) throw new Error(await res.text())
-    return res.json()
+    // The API pages newest-first (TASK_PAGE_SIZE per page); follow the
+    // after/after_id cursor until a short page says there is nothing older
+    const tasks = []
+    let query = ''
+    for (;;) {
+      const res = await fetch(`/api/tasks${query}`, { credentials: 'include' })
+      if (!res.ok) throw new Error(await res.text())
+      const page = await res.json()
+      tasks.push(...page)
+      if (page.length < TASK_PAGE_SIZE) return tasks
+      const last = page[page.length - 1]
+      query = '?' + new URLSearchParams({ after: last.created_at, after_id: String(last.id) })
+    }
   },
   async createTask(title, emailHint) {
     const res = await fetch('/api/tasks', {
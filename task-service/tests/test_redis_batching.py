@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from redis_batching import BatchingRedisLookup
+
+
+class FakeRedis:
+    def __init__(self, data=None, error=None):
+        self.data = data or {}
+        self.error = error
+        self.calls = []
+
+    async def mget(self, keys):
+        self.calls.append(list(keys))
+        if self.error:
+            raise self.error
+        return [self.data.get(k) for k in keys]
+
+
+def test_gets_in_the_same_tick_share_one_mget():
+    client = FakeRedis({"sid:a": "1", "sid:b": "2"})
+    lookup = BatchingRedisLookup(client)
+
+    async def run():
+        return await asyncio.gather(lookup.get("sid:a"), lookup.get("sid:b"), lookup.get("sid:missing"))
+
+    assert asyncio.run(run()) == ["1", "2", None]
+    assert client.calls == [["sid:a", "sid:b", "sid:missing"]]
+
+
+def test_duplicate_keys_are_fetched_once():
+    client = FakeRedis({"sid:a": "1"})
+    lookup = BatchingRedisLookup(client)
+
+    async def run():
+        return await asyncio.gather(lookup.get("sid:a"), lookup.get("sid:a"))
+
+    assert asyncio.run(run()) == ["1", "1"]
+    assert client.calls == [["sid:a"]]
+
+
+def test_sequential_gets_flush_separately():
+    client = FakeRedis({"sid:a": "1", "sid:b": "2"})
+    lookup = BatchingRedisLookup(client)
+
+    async def run():
+        return [await lookup.get("sid:a"), await lookup.get("sid:b")]
+
+    assert asyncio.run(run()) == ["1", "2"]
+    assert client.calls == [["sid:a"], ["sid:b"]]
+
+
+def test_mget_error_is_raised_to_every_waiter():
+    client = FakeRedis(error=ConnectionError("redis down"))
+    lookup = BatchingRedisLookup(client)
+
+    async def run():
+        return await asyncio.gather(lookup.get("sid:a"), lookup.get("sid:b"), return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert len(results) == 2
+    assert all(isinstance(r, ConnectionError) for r in results)
+
+
+def test_cancelled_waiter_does_not_break_the_batch():
+    client = FakeRedis({"sid:a": "1", "sid:b": "2"})
+    lookup = BatchingRedisLookup(client)
+
+    async def run():
+        cancelled = asyncio.ensure_future(lookup.get("sid:a"))
+        kept = asyncio.ensure_future(lookup.get("sid:b"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        return await kept
+
+    assert asyncio.run(run()) == "2"